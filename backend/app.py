@@ -1,11 +1,15 @@
 """
-Refactored Flask application following OOP principles.
+Refactored FastAPI application following OOP principles.
 Uses dependency injection and separation of concerns.
 """
-from flask import Flask, jsonify, request
-from flask_cors import CORS
+from fastapi import FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
+import orjson
+import uvicorn
 import os
 import asyncio
+import logging
+from contextlib import asynccontextmanager
 from urllib.parse import urlencode
 
 from services import (
@@ -24,21 +28,32 @@ class VoteHubApplication:
 
     def __init__(self):
         """Initialize the application with all dependencies."""
-        # Initialize Flask app
-        self.app = Flask(__name__)
-        CORS(self.app)
+        # Initialize FastAPI app
+        self.app = FastAPI(lifespan=self._lifespan)
+        self.app.add_middleware(
+            CORSMiddleware,
+            allow_origins=['*'],
+            allow_methods=['*'],
+            allow_headers=['*'],
+            expose_headers=['X-Cache']
+        )
+        self.logger = logging.getLogger('uvicorn.error')
+
+        # Bound concurrent division processing (created lazily on the running loop)
+        self.division_concurrency = int(os.getenv('DIVISION_CONCURRENCY', '8'))
+        self._division_sem = None
 
         # Initialize core services
         self.api_service = ApiService()
         self.choice_service = ChoiceService()
 
         # Initialize agent services
-        self.name_correction_service = NameCorrectionService(self.app.logger)
-        self.party_affiliation_service = PartyAffiliationService(self.app.logger)
-        self.poll_params_service = PollParamsService(self.app.logger)
+        self.name_correction_service = NameCorrectionService(self.logger)
+        self.party_affiliation_service = PartyAffiliationService(self.logger)
+        self.poll_params_service = PollParamsService(self.logger)
 
         # Initialize color service (depends on party affiliation service)
-        self.color_service = ColorService(self.choice_service, self.app.logger)
+        self.color_service = ColorService(self.choice_service, self.logger)
 
         # Initialize processor with injected dependencies
         self.poll_processor = PollProcessor(
@@ -46,7 +61,7 @@ class VoteHubApplication:
             color_service=self.color_service,
             name_correction_service=self.name_correction_service,
             party_affiliation_service=self.party_affiliation_service,
-            logger=self.app.logger
+            logger=self.logger
         )
 
         # Register routes
@@ -60,55 +75,94 @@ class VoteHubApplication:
         required_vars = ['OPENAI_API_KEY']
         missing = [var for var in required_vars if not os.getenv(var)]
         if missing:
-            self.app.logger.warning(
+            self.logger.warning(
                 f"Missing environment variables: {', '.join(missing)}"
             )
 
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """
+        Manage resources that live for the lifetime of the application.
+
+        Args:
+            app: The FastAPI application
+        """
+        yield
+        await self.api_service.aclose()
+
     def _register_routes(self):
         """Register all application routes."""
-        self.app.route('/api/health', methods=['GET'])(self.health)
-        self.app.route('/api/polls', methods=['GET'])(self.get_polls)
+        self.app.get('/api/health')(self.health)
+        self.app.get('/api/polls')(self.get_polls)
 
-    def health(self):
+    async def health(self):
         """
         Health check endpoint.
 
         Returns:
             JSON response with health status
         """
-        return jsonify({
+        return {
             'status': 'healthy',
-            'message': 'Flask backend is running!'
-        })
+            'message': 'FastAPI backend is running!'
+        }
+
+    @staticmethod
+    def _json_response(content, status_code: int = 200, headers: dict = None) -> Response:
+        """
+        Build a JSON response serialized with orjson.
+
+        Args:
+            content: JSON-serializable response body
+            status_code: HTTP status code
+            headers: Optional extra response headers
+
+        Returns:
+            Response with an application/json body
+        """
+        return Response(
+            orjson.dumps(content),
+            status_code=status_code,
+            headers=headers,
+            media_type='application/json'
+        )
 
-    def get_polls(self):
+    async def get_polls(self, q: str = ''):
         """
         Get polls endpoint.
         Processes user query and returns organized poll data with color mappings.
 
+        Args:
+            q: Natural language query from user
+
         Returns:
             JSON response with poll divisions and color maps
         """
         try:
-            # Extract query parameter
-            user_query = request.args.get('q', '')
-            if not user_query:
-                return jsonify({'error': 'Query parameter "q" is required'}), 400
-
-            # Convert query to VoteHub API parameters
-            votehub_params = self._convert_query_to_params(user_query)
+            if not q:
+                return self._json_response(
+                    {'error': 'Query parameter "q" is required'},
+                    status_code=400
+                )
+
+            # Convert query to VoteHub API parameters (blocking agent call)
+            votehub_params = await asyncio.to_thread(
+                self._convert_query_to_params, q
+            )
 
-            # Fetch polls from VoteHub API
-            polls_data = self._fetch_polls(votehub_params)
+            # Stream polls from VoteHub API
+            polls, cache_hit = await self._fetch_polls(votehub_params)
 
             # Process polls and return results
-            result = asyncio.run(self._process_polls(polls_data))
-
-            return jsonify(result)
+            result = await self._process_polls(polls)
+            return self._json_response(
+                result,
+                headers={'X-Cache': 'HIT' if cache_hit else 'MISS'}
+            )
 
         except Exception as e:
-            self.app.logger.error(f"Error in get_polls: {e}")
-            return jsonify({'error': 'Internal server error'}), 500
+            self.logger.error(f"Error in get_polls: {e}")
+            return self._json_response({'error': 'Internal server error'}, status_code=500)
 
     def _convert_query_to_params(self, user_query: str) -> dict:
         """
@@ -123,76 +177,113 @@ class VoteHubApplication:
         params_dict = self.poll_params_service.extract_params_as_dict(user_query)
 
         query_string = urlencode(params_dict)
-        self.app.logger.info(f"Polls API query string: {query_string}")
+        self.logger.info(f"Polls API query string: {query_string}")
 
         return params_dict
 
-    def _fetch_polls(self, params: dict) -> list:
+    async def _fetch_polls(self, params: dict) -> tuple:
         """
-        Fetch polls from VoteHub API.
+        Start streaming polls from VoteHub API.
 
         Args:
             params: Query parameters for the API
 
         Returns:
-            List of poll dictionaries
+            Tuple of (async iterator of poll dictionaries, whether it was a cache hit)
         """
         query_string = urlencode(params)
         url = f"https://api.votehub.com/polls?{query_string}"
-        return self.api_service.get(url)
+        return await self.api_service.aget_stream(url)
 
-    async def _process_polls(self, polls_data: list) -> dict:
+    async def _process_polls(self, polls) -> dict:
         """
         Process poll data into divisions with color maps.
 
         Args:
-            polls_data: Raw poll data from API
+            polls: Async iterator of raw poll dictionaries from the API
 
         Returns:
             Dictionary mapping division keys to processed data
         """
-        # Divide polls by subject and poll_type
-        divisions = self.poll_processor.divide_polls(polls_data)
+        # Divide polls by subject and poll_type as they stream in
+        divisions = await self.poll_processor.divide_polls_stream(polls)
+
+        # Correct names for all divisions in one batched call
+        name_corrections = await self.poll_processor.get_name_corrections_for_divisions(
+            divisions
+        )
+
+        # Apply corrections and find each division's top choices
+        top_choices = {
+            key: self.poll_processor.prepare_division(
+                key, polls, name_corrections.get(key, {})
+            )
+            for key, polls in divisions.items()
+        }
+
+        # Look up party affiliations for all divisions in one batched call
+        affiliations = await self.poll_processor.get_party_affiliations_for_divisions(
+            top_choices
+        )
 
-        # Process each division concurrently
+        # Compute color maps for each division concurrently
         tasks = [
-            self._process_single_division(key, polls)
+            self._process_single_division(key, polls, top_choices[key], affiliations)
             for key, polls in divisions.items()
         ]
 
         results = await asyncio.gather(*tasks)
 
-        # Convert to dictionary
-        return {key: result for key, result in results}
-
-    async def _process_single_division(self, key: str, polls: list) -> tuple:
+        # Convert to dictionary keyed by "subject_polltype"
+        return {
+            self.poll_processor.format_division_key(key): result
+            for key, result in results
+        }
+
+    async def _process_single_division(
+        self,
+        key: tuple,
+        polls: list,
+        top_choices: list,
+        affiliations: list
+    ) -> tuple:
         """
-        Process a single poll division.
+        Compute the color map for a single prepared poll division.
 
         Args:
-            key: Division identifier
+            key: Division identifier as (subject, poll_type)
             polls: List of polls in division
+            top_choices: Top choices of the division
+            affiliations: Party affiliations fetched for all divisions
 
         Returns:
             Tuple of (key, processed_data)
         """
+        if self._division_sem is None:
+            self._division_sem = asyncio.Semaphore(self.division_concurrency)
+
         try:
-            result = await self.poll_processor.process_division(key, polls)
+            async with self._division_sem:
+                result = await self.poll_processor.color_division(
+                    key, polls, top_choices, affiliations
+                )
             return (key, result)
-        except Exception as e:
-            self.app.logger.error(f"Error processing division {key}: {e}")
+        except Exception:
+            self.logger.exception(
+                "Error processing division %s",
+                self.poll_processor.format_division_key(key)
+            )
             return (key, {'polls': polls, 'color_map': {}})
 
-    def run(self, host='0.0.0.0', port=5000, debug=True):
+    def run(self, host='0.0.0.0', port=5000):
         """
-        Run the Flask application.
+        Run the application with Uvicorn on uvloop and httptools.
 
         Args:
             host: Host to bind to
             port: Port to bind to
-            debug: Debug mode flag
         """
-        self.app.run(host=host, port=port, debug=debug)
+        uvicorn.run(self.app, host=host, port=port, loop='uvloop', http='httptools')
 
 
 # Create application instance
@@ -1,4 +1,7 @@
-from pydantic import BaseModel, Field
+import sys
+
+from pydantic import BaseModel, Field, field_validator
+from pydantic.dataclasses import dataclass
 
 from typing import Optional
 
@@ -11,14 +14,22 @@ class VoteHubRequestParams(BaseModel):
     min_sample_size: Optional[int] = Field(default=None, description="The minimum sample size to use")
     population: Optional[str] = Field(default=None, description="The population to use")
 
-class PartyAffiliation(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PartyAffiliation:
     party: str = Field(description="The party of the person")
     person: str = Field(description="The name of the person")
 
+    @field_validator('person')
+    @classmethod
+    def intern_person(cls, value: str) -> str:
+        # Names recur across polls and are used as lookup keys
+        return sys.intern(value)
+
 class PartyAffiliationList(BaseModel):
     party_affiliations: list[PartyAffiliation] = Field(description="The results of party affiliation determinations")
 
-class NameCorrection(BaseModel):
+@dataclass(slots=True, frozen=True)
+class NameCorrection:
     incorrect_name: str = Field(description="The incorrect name of a choice")
     correct_name: str = Field(description="The correct name of a choice")
 
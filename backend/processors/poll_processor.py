@@ -2,10 +2,22 @@
 Processor for handling poll data operations.
 Coordinates between services to process poll divisions.
 """
-from typing import Dict, Any, List
+import logging
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterable
 from logging import Logger
 from collections import defaultdict
 
+from models import PartyAffiliation
+
+# Option pairs that identify standard polls, which need no name correction
+_STANDARD_PAIRS = (
+    frozenset({'dem', 'rep'}),
+    frozenset({'approve', 'disapprove'}),
+    frozenset({'favorable', 'unfavorable'}),
+    frozenset({'yes', 'no'})
+)
+_STANDARD_TOKENS = frozenset().union(*_STANDARD_PAIRS)
+
 
 class PollProcessor:
     """Processes poll data including deduplication and color assignment."""
@@ -34,60 +46,163 @@ class PollProcessor:
         self.party_affiliation_service = party_affiliation_service
         self.logger = logger
 
-    def divide_polls(self, polls: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    @staticmethod
+    def format_division_key(division_key: Tuple[str, str]) -> str:
         """
-        Divide polls by subject and poll_type.
+        Format a division key as the "subject_polltype" string used in responses.
 
         Args:
-            polls: List of poll dictionaries
+            division_key: Division identifier as (subject, poll_type)
 
         Returns:
-            Dictionary mapping division keys to lists of polls
+            Division key string
+        """
+        subject, poll_type = division_key
+        return f"{subject}_{poll_type}"
+
+    async def divide_polls_stream(
+        self,
+        polls: AsyncIterable[Dict[str, Any]]
+    ) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """
+        Divide polls by subject and poll_type as they arrive from a stream.
+
+        Args:
+            polls: Async iterable of poll dictionaries
+
+        Returns:
+            Dictionary mapping (subject, poll_type) keys to lists of polls
         """
         divisions = defaultdict(list)
-        for poll in polls:
-            key = f"{poll.get('subject', 'unknown')}_{poll.get('poll_type', 'unknown')}"
-            divisions[key].append(poll)
+        async for poll in polls:
+            divisions[(poll.get('subject', 'unknown'), poll.get('poll_type', 'unknown'))].append(poll)
         return dict(divisions)
 
-    async def process_division(
+    async def get_name_corrections_for_divisions(
         self,
-        division_key: str,
-        division_polls: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+        divisions: Dict[Tuple[str, str], List[Dict[str, Any]]]
+    ) -> Dict[Tuple[str, str], Dict[str, str]]:
         """
-        Process a single poll division.
+        Get name corrections for all divisions with one batched service call.
+        Skips divisions with no choices or standard options (Dem/Rep, etc.)
 
         Args:
-            division_key: Division identifier (subject_polltype)
-            division_polls: List of polls in this division
+            divisions: Mapping of division keys to lists of polls
 
         Returns:
-            Dictionary with processed polls and color map
+            Dictionary mapping division keys to their name corrections
         """
-        try:
-            # Extract distinct choices
+        groups = {}
+        for division_key, division_polls in divisions.items():
             distinct_choices = self.choice_service.extract_distinct_choices(division_polls)
+            if not distinct_choices:
+                continue
+            if self._should_skip_name_correction(distinct_choices):
+                self.logger.info(
+                    f"Skipping name correction for division "
+                    f"{self.format_division_key(division_key)} - standard options"
+                )
+                continue
+            groups[division_key] = sorted(distinct_choices)
 
-            # Get name corrections
-            name_corrections_map = await self._get_name_corrections(distinct_choices, division_key)
+        if not groups:
+            return {}
 
-            # Apply corrections and deduplicate
-            self._apply_corrections_to_polls(division_polls, name_corrections_map)
+        try:
+            return await self.name_correction_service.get_corrections_batched(groups)
+        except Exception as e:
+            self.logger.error(f"Error getting batched name corrections: {e}")
+            return {}
 
-            # Calculate choice statistics
-            unique_choices = self.choice_service.calculate_choice_statistics(division_polls)
+    async def get_party_affiliations_for_divisions(
+        self,
+        top_choices: Dict[Tuple[str, str], List[str]]
+    ) -> List[PartyAffiliation]:
+        """
+        Get party affiliations for all divisions with one batched service call.
+        Only divisions whose colors depend on party affiliations are included.
+
+        Args:
+            top_choices: Mapping of division keys to their top choices
+
+        Returns:
+            List of PartyAffiliation objects for the gathered names
+        """
+        names = set()
+        for (_, poll_type), choices in top_choices.items():
+            if choices and self.color_service.needs_party_affiliations(
+                choices,
+                poll_type or 'unknown'
+            ):
+                names.update(choices)
+
+        if not names:
+            return []
+
+        try:
+            return await self.party_affiliation_service.get_affiliations_batched(sorted(names))
+        except Exception as e:
+            self.logger.error(f"Error getting batched party affiliations: {e}")
+            return []
+
+    def prepare_division(
+        self,
+        division_key: Tuple[str, str],
+        division_polls: List[Dict[str, Any]],
+        name_corrections_map: Dict[str, str]
+    ) -> List[str]:
+        """
+        Apply name corrections to a division and find its top choices.
+
+        Args:
+            division_key: Division identifier as (subject, poll_type)
+            division_polls: List of polls in this division (modified in place)
+            name_corrections_map: Mapping of incorrect to correct names
+
+        Returns:
+            Display names of the top 10 choices by average percentage
+        """
+        try:
+            # Apply corrections, deduplicate and calculate choice statistics
+            unique_choices = self._apply_corrections_to_polls(division_polls, name_corrections_map)
 
             # Get top 10 choices
-            top_10_choices = [item['display_name'] for item in unique_choices[:10]]
+            return [item['display_name'] for item in unique_choices[:10]]
+
+        except Exception as e:
+            self.logger.error(
+                f"Error preparing division {self.format_division_key(division_key)}: {e}"
+            )
+            return []
+
+    async def color_division(
+        self,
+        division_key: Tuple[str, str],
+        division_polls: List[Dict[str, Any]],
+        top_choices: List[str],
+        preloaded_affiliations: Optional[List[PartyAffiliation]] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute the color map for a prepared division.
 
+        Args:
+            division_key: Division identifier as (subject, poll_type)
+            division_polls: List of prepared polls in this division
+            top_choices: Display names of the division's top choices
+            preloaded_affiliations: Party affiliations fetched ahead of time
+
+        Returns:
+            Dictionary with processed polls and color map
+        """
+        try:
             # Compute color map
-            poll_type = division_key.split('_', 1)[1] if '_' in division_key else 'unknown'
+            poll_type = division_key[1] or 'unknown'
             color_map = await self.color_service.compute_color_map(
-                top_10_choices,
+                top_choices,
                 poll_type,
-                self.party_affiliation_service
-            ) if top_10_choices else {}
+                self.party_affiliation_service,
+                preloaded_affiliations=preloaded_affiliations
+            ) if top_choices else {}
 
             return {
                 'polls': division_polls,
@@ -95,7 +210,9 @@ class PollProcessor:
             }
 
         except Exception as e:
-            self.logger.error(f"Error processing division {division_key}: {e}")
+            self.logger.error(
+                f"Error processing division {self.format_division_key(division_key)}: {e}"
+            )
             return {
                 'polls': division_polls,
                 'color_map': {}
@@ -117,101 +234,65 @@ class PollProcessor:
         Returns:
             True if name correction should be skipped, False otherwise
         """
-        # Normalize choices for comparison
-        normalized_choices = [
+        # Normalize choices for comparison, keeping only standard option tokens
+        standard_choices = _STANDARD_TOKENS.intersection(
             self.choice_service.normalize(choice).lower()
             for choice in distinct_choices
-        ]
+        )
 
-        # Define standard option pairs
-        standard_pairs = [
-            {'dem', 'rep'},
-            {'approve', 'disapprove'},
-            {'favorable', 'unfavorable'},
-            {'yes', 'no'}
-        ]
+        # A pair needs at least two standard tokens
+        if len(standard_choices) < 2:
+            return False
 
         # Check if choices match any standard pair
-        choices_set = set(normalized_choices)
-        for pair in standard_pairs:
+        for pair in _STANDARD_PAIRS:
             # If both options from a pair are present, skip name correction
-            if pair.issubset(choices_set):
+            if pair <= standard_choices:
                 self.logger.info(
-                    f"Skipping name correction - standard options detected: {pair}"
+                    f"Skipping name correction - standard options detected: {set(pair)}"
                 )
                 return True
 
         return False
 
-    async def _get_name_corrections(
-        self,
-        distinct_choices: List[str],
-        division_key: str
-    ) -> Dict[str, str]:
-        """
-        Get name corrections for choices using the name correction service.
-        Skips correction for standard option polls (Dem/Rep, Approve/Disapprove, etc.)
-
-        Args:
-            distinct_choices: List of distinct choice names
-            division_key: Division identifier for logging
-
-        Returns:
-            Dictionary mapping incorrect names to correct names
-        """
-        if not distinct_choices:
-            return {}
-
-        # Check if this is a standard option poll (skip name correction)
-        if self._should_skip_name_correction(distinct_choices):
-            self.logger.info(
-                f"Skipping name correction for division {division_key} - standard options"
-            )
-            return {}
-
-        try:
-            self.logger.info(
-                f"Getting name corrections for {len(distinct_choices)} choices in {division_key}"
-            )
-
-            # Use the name correction service instead of direct function
-            name_corrections_map = await self.name_correction_service.get_corrections(
-                distinct_choices
-            )
-
-            self.logger.info(f"Received {len(name_corrections_map)} name corrections")
-            return name_corrections_map
-
-        except Exception as e:
-            self.logger.error(f"Error getting name corrections: {e}")
-            return {}
-
     def _apply_corrections_to_polls(
         self,
         polls: List[Dict[str, Any]],
         name_corrections: Dict[str, str]
-    ) -> None:
+    ) -> List[Dict[str, Any]]:
         """
         Apply name corrections and deduplicate answers in polls.
+        Choice statistics are collected in the same pass over the answers.
 
         Args:
             polls: List of poll dictionaries (modified in place)
             name_corrections: Mapping of incorrect to correct names
+
+        Returns:
+            List of choice statistics sorted by average percentage
         """
+        choice_stats = self.choice_service.new_choice_statistics()
+        log_merges = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Bind hot-loop methods once
+        deduplicate = self.choice_service.deduplicate_answers
+        accumulate = self.choice_service.accumulate_choice_statistics
+        log_debug = self.logger.debug
+
         for poll in polls:
-            answers = poll.get('answers', [])
+            answers = poll.get('answers') or ()
 
             # Apply corrections and deduplicate
-            final_answers = self.choice_service.deduplicate_answers(
-                answers,
-                name_corrections
-            )
+            final_answers = deduplicate(answers, name_corrections)
 
             # Log any merges
-            if len(final_answers) < len(answers):
-                self.logger.info(
+            if log_merges and len(final_answers) < len(answers):
+                log_debug(
                     f"Merged {len(answers)} answers to {len(final_answers)} "
                     f"in poll {poll.get('id', 'unknown')}"
                 )
 
             poll['answers'] = final_answers
+            accumulate(choice_stats, final_answers)
+
+        return self.choice_service.summarize_choice_statistics(choice_stats)
@@ -2,10 +2,91 @@
 Base service class for AI agent operations.
 Provides common functionality for agent-based services.
 """
+import asyncio
+import os
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Awaitable, Callable, Dict, Hashable, MutableMapping, Tuple
 from logging import Logger
 
+from cachetools import LRUCache
+
+
+# Upper bound on concurrent agent runs across the process, sized to the
+# provider's concurrent-request budget
+LLM_CONCURRENCY = int(os.getenv('LLM_CONCURRENCY', '8'))
+_llm_sem = None
+
+
+def llm_slot() -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding concurrent agent runs.
+
+    The semaphore is shared by every agent caller in the process and created
+    lazily on the running loop. Hold it around each agent run so bursts
+    queue here instead of triggering provider rate-limit backoff.
+
+    Returns:
+        Shared asyncio.Semaphore
+    """
+    global _llm_sem
+    if _llm_sem is None:
+        _llm_sem = asyncio.Semaphore(LLM_CONCURRENCY)
+    return _llm_sem
+
+
+async def coalesce_call(
+    cache: MutableMapping,
+    inflight: Dict[Hashable, asyncio.Future],
+    key: Hashable,
+    call: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Run an agent call once per key, sharing its result.
+
+    Results are kept in the given cache, and concurrent callers with the
+    same key await a single in-flight call. Failed calls are not cached.
+
+    Args:
+        cache: Mapping holding completed results (e.g. a cachetools cache)
+        inflight: Mapping holding in-flight calls, private to this cache
+        key: Hashable key identifying the call's input
+        call: Zero-argument coroutine function performing the call
+
+    Returns:
+        The (possibly shared) result of the call
+    """
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(call())
+        inflight[key] = task
+        task.add_done_callback(lambda t: _finish_call(cache, inflight, key, t))
+
+    return await asyncio.shield(task)
+
+
+def _finish_call(
+    cache: MutableMapping,
+    inflight: Dict[Hashable, asyncio.Future],
+    key: Hashable,
+    task: asyncio.Task
+):
+    """
+    Store a completed call in its cache and clear its in-flight entry.
+
+    Args:
+        cache: Mapping holding completed results
+        inflight: Mapping holding in-flight calls
+        key: The key the call was made for
+        task: The completed call task
+    """
+    inflight.pop(key, None)
+    if not task.cancelled() and task.exception() is None:
+        cache[key] = task.result()
+
 
 class AgentService(ABC):
     """
@@ -16,15 +97,18 @@ class AgentService(ABC):
     lookup, or parameter extraction.
     """
 
-    def __init__(self, logger: Logger = None):
+    def __init__(self, logger: Logger = None, cache_size: int = 256):
         """
         Initialize the agent service.
 
         Args:
             logger: Optional logger instance for logging operations
+            cache_size: Maximum number of agent results kept by _coalesce
         """
         self.logger = logger
         self._agent = None
+        self._results = LRUCache(maxsize=cache_size)
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
 
     @abstractmethod
     def _create_agent(self):
@@ -33,6 +117,9 @@ class AgentService(ABC):
 
         This method should be implemented by subclasses to create
         their specific agent with appropriate tools and prompts.
+        Instructions and tool lists should be static and deterministically
+        ordered, with per-call data only in the user input, so the
+        provider's prompt prefix cache can be reused across calls.
 
         Returns:
             Configured agent instance
@@ -54,6 +141,50 @@ class AgentService(ABC):
             self._agent = self._create_agent()
         return self._agent
 
+    async def _coalesce(self, key: Tuple, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run an agent call once per key, sharing its result.
+
+        Uses coalesce_call with this service's LRU result cache.
+
+        Args:
+            key: Hashable key identifying the call's input
+            call: Zero-argument coroutine function performing the call
+
+        Returns:
+            The (possibly shared) result of the call
+        """
+        if key in self._results:
+            self._log_info(f"Agent result cache hit for {len(key)} inputs")
+        elif key in self._inflight:
+            self._log_info(f"Joining in-flight agent call for {len(key)} inputs")
+
+        return await coalesce_call(self._results, self._inflight, key, call)
+
+    def _is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether a message at the given level would be logged.
+
+        Lets callers skip building expensive log messages.
+
+        Args:
+            level: Logging level (e.g. logging.DEBUG)
+
+        Returns:
+            True if a logger is available and enabled for the level
+        """
+        return self.logger is not None and self.logger.isEnabledFor(level)
+
+    def _log_debug(self, message: str):
+        """
+        Log a debug message if logger is available.
+
+        Args:
+            message: Message to log
+        """
+        if self.logger:
+            self.logger.debug(message)
+
     def _log_info(self, message: str):
         """
         Log an info message if logger is available.
@@ -64,6 +195,16 @@ class AgentService(ABC):
         if self.logger:
             self.logger.info(message)
 
+    def _log_prompt_cache_usage(self, input_tokens: int, cached_tokens: int):
+        """
+        Log how many input tokens were served from the provider's prompt cache.
+
+        Args:
+            input_tokens: Total input tokens billed for the call
+            cached_tokens: Input tokens read from the prompt cache
+        """
+        self._log_info(f"Prompt cache: {cached_tokens}/{input_tokens} input tokens cached")
+
     def _log_error(self, message: str):
         """
         Log an error message if logger is available.
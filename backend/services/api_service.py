@@ -2,35 +2,140 @@
 Service for making external API calls.
 Encapsulates HTTP communication logic.
 """
-import requests
-from typing import Dict, Any
+import asyncio
+import orjson
+import httpx
+import ijson
+from cachetools import TTLCache
+from typing import Dict, Any, Tuple, AsyncIterator
 
 
 class ApiService:
     """Handles external API communication."""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, cache_ttl: int = 300, cache_size: int = 512):
         """
         Initialize the API service.
 
         Args:
             timeout: Request timeout in seconds
+            cache_ttl: Seconds a cached response stays fresh
+            cache_size: Maximum number of cached responses
         """
         self.timeout = timeout
+        self._client = None
+        self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}
 
-    def get(self, url: str) -> Dict[str, Any]:
+    async def client(self) -> httpx.AsyncClient:
         """
-        Make a GET request to the specified URL.
+        Lazily create the process-wide pooled HTTP client.
+
+        The client keeps connections alive and negotiates HTTP/2, so the
+        TLS handshake with the upstream API is paid once rather than per call.
+
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+                timeout=self.timeout,
+            )
+        return self._client
+
+    async def aget_stream(self, url: str) -> Tuple[AsyncIterator[Dict[str, Any]], bool]:
+        """
+        Stream the items of a JSON array response, sharing the response cache.
+
+        On a cache miss the body is parsed incrementally while it downloads,
+        so callers can start consuming items before the fetch finishes; the
+        raw body is cached once the stream completes.
 
         Args:
             url: The URL to make the request to
 
         Returns:
-            JSON response as a dictionary
+            Tuple of (async iterator of array items, whether it was served
+            without a new fetch)
+        """
+        content = self._cache.get(url)
+        if content is None and url in self._inflight:
+            content = await asyncio.shield(self._inflight[url])
+
+        if content is not None:
+            return self._iter_content(content), True
+        return self._stream_and_cache(url), False
+
+    async def _iter_content(self, content: bytes) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over the items of a cached JSON array body.
+
+        Args:
+            content: Raw response body
+
+        Yields:
+            Parsed array items
+        """
+        for item in orjson.loads(content):
+            yield item
+
+    async def _stream_and_cache(self, url: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch a JSON array, yielding items as they are parsed from the stream.
+
+        Concurrent callers for the same URL wait on the in-flight entry and
+        receive the cached body once this stream completes.
+
+        Args:
+            url: The URL to make the request to
+
+        Yields:
+            Parsed array items
 
         Raises:
-            requests.RequestException: If the request fails
+            httpx.HTTPError: If the request fails
         """
-        response = requests.get(url, timeout=self.timeout)
-        response.raise_for_status()
-        return response.json()
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        chunks = []
+
+        try:
+            client = await self.client()
+            async with client.stream('GET', url) as response:
+                response.raise_for_status()
+
+                items = ijson.sendable_list()
+                parser = ijson.items_coro(items, 'item', use_float=True)
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    parser.send(chunk)
+                    for item in items:
+                        yield item
+                    del items[:]
+                parser.close()
+                for item in items:
+                    yield item
+
+            content = b''.join(chunks)
+            self._cache[url] = content
+            future.set_result(content)
+
+        except BaseException as e:
+            if not future.done():
+                if not isinstance(e, Exception):
+                    e = RuntimeError(f"Fetch of {url} did not complete")
+                future.set_exception(e)
+                # Mark the exception retrieved in case nobody is waiting
+                future.exception()
+            raise
+
+        finally:
+            self._inflight.pop(url, None)
+
+    async def aclose(self):
+        """Close the pooled HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -2,8 +2,27 @@
 Service for processing and normalizing poll choices.
 Handles choice deduplication, normalization, and statistics calculation.
 """
+import sys
 from typing import List, Dict, Any
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+
+# Characters stripped by normalization, removed in a single translate pass
+_NORMALIZE_TABLE = str.maketrans('', '', '.,')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(choice: str) -> str:
+    """Memoized implementation of ChoiceService.normalize."""
+    # Interned so recurring names share one object as dict and set keys
+    return sys.intern(choice.translate(_NORMALIZE_TABLE).strip())
+
+
+@lru_cache(maxsize=4096)
+def _normalize_lower_cached(choice: str) -> str:
+    """Memoized implementation of ChoiceService.normalize_lower."""
+    return _normalize_cached(choice).lower()
 
 
 class ChoiceService:
@@ -21,60 +40,96 @@ class ChoiceService:
         Returns:
             Normalized choice name
         """
-        return choice.replace('.', '').replace(',', '').strip()
+        if not choice:
+            return ''
+        return _normalize_cached(choice)
+
+    @staticmethod
+    def normalize_lower(choice: str) -> str:
+        """
+        Normalize a choice name and lowercase it for case-insensitive matching.
+
+        Args:
+            choice: The choice name to normalize
+
+        Returns:
+            Lowercased normalized choice name
+        """
+        if not choice:
+            return ''
+        return _normalize_lower_cached(choice)
+
+    @staticmethod
+    def new_choice_statistics() -> Dict[str, List[Any]]:
+        """
+        Create an empty running-statistics container.
+
+        Returns:
+            defaultdict yielding a fresh [total, count, display_name] entry
+            for each unseen normalized choice
+        """
+        return defaultdict(lambda: [0, 0, ''])
+
+    def accumulate_choice_statistics(
+        self,
+        choice_stats: Dict[str, List[Any]],
+        answers: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Add one poll's answers to running choice statistics.
+
+        Lets callers that already loop over polls collect statistics in the
+        same pass instead of scanning the answers again.
+
+        Args:
+            choice_stats: Running statistics from new_choice_statistics
+                (modified in place)
+            answers: List of answer dictionaries
+        """
+        normalize = self.normalize
+
+        for answer in answers:
+            choice = answer.get('choice', '')
+            normalized = normalize(choice)
+
+            stats = choice_stats[normalized]
 
-    def calculate_choice_statistics(
+            # Use the first version seen, then the shortest, as display name
+            if stats[1] == 0 or len(choice) < len(stats[2]):
+                stats[2] = choice
+
+            stats[0] += answer.get('pct', 0)
+            stats[1] += 1
+
+    def summarize_choice_statistics(
         self,
-        polls: List[Dict[str, Any]]
+        choice_stats: Dict[str, List[Any]]
     ) -> List[Dict[str, Any]]:
         """
-        Calculate statistics for all choices across polls.
+        Turn running choice statistics into averages sorted by percentage.
 
         Args:
-            polls: List of poll dictionaries
+            choice_stats: Running [total, count, display_name] statistics keyed
+                by normalized choice
 
         Returns:
             List of choice statistics sorted by average percentage
         """
-        choice_stats = {}
-
-        for poll in polls:
-            for answer in poll.get('answers', []):
-                choice = answer.get('choice', '')
-                normalized = self.normalize(choice)
-
-                if normalized not in choice_stats:
-                    choice_stats[normalized] = {
-                        'total': 0,
-                        'count': 0,
-                        'display_name': choice,
-                        'original_names': []
-                    }
-
-                stats = choice_stats[normalized]
-                stats['total'] += answer.get('pct', 0)
-                stats['count'] += 1
-                stats['original_names'].append(choice)
-
-                # Use the shortest version as display name
-                if len(choice) < len(stats['display_name']):
-                    stats['display_name'] = choice
-
-        # Sort choices by average percentage
-        unique_choices = sorted(
-            [
-                {
-                    'normalized': normalized,
-                    'display_name': stats['display_name'],
-                    'average': stats['total'] / stats['count'] if stats['count'] > 0 else 0
-                }
-                for normalized, stats in choice_stats.items()
-            ],
-            key=lambda x: x['average'],
-            reverse=True
-        )
-
-        return unique_choices
+        # Sort (normalized, display_name, average) tuples in place by average
+        ranked = [
+            (normalized, display_name, total / count if count > 0 else 0)
+            for normalized, (total, count, display_name) in choice_stats.items()
+        ]
+        ranked.sort(key=itemgetter(2), reverse=True)
+
+        return [
+            {
+                'normalized': normalized,
+                'display_name': display_name,
+                'average': average
+            }
+            for normalized, display_name, average in ranked
+        ]
 
     def deduplicate_answers(
         self,
@@ -91,35 +146,20 @@ class ChoiceService:
         Returns:
             List of deduplicated answers
         """
-        # Apply corrections
-        for answer in answers:
-            original_choice = answer.get('choice', '')
-            if original_choice in name_corrections:
-                answer['choice'] = name_corrections[original_choice]
-
-        # Deduplicate
-        deduplicated = {}
+        # Apply corrections and deduplicate in one pass, keeping a running
+        # [mean, count] per choice and leaving the caller's answers untouched
+        deduplicated = defaultdict(lambda: [0.0, 0])
+        correct = name_corrections.get
         for answer in answers:
             choice = answer.get('choice', '')
-            pct = answer.get('pct', 0)
-
-            if choice in deduplicated:
-                deduplicated[choice]['total'] += pct
-                deduplicated[choice]['count'] += 1
-            else:
-                deduplicated[choice] = {
-                    'choice': choice,
-                    'total': pct,
-                    'count': 1
-                }
-
-        # Calculate averages
-        final_answers = []
-        for choice, data in deduplicated.items():
-            avg_pct = data['total'] / data['count']
-            final_answers.append({'choice': choice, 'pct': avg_pct})
-
-        return final_answers
+            entry = deduplicated[correct(choice, choice)]
+            entry[1] += 1
+            entry[0] += (answer.get('pct', 0) - entry[0]) / entry[1]
+
+        return [
+            {'choice': choice, 'pct': mean}
+            for choice, (mean, _) in deduplicated.items()
+        ]
 
     def extract_distinct_choices(self, polls: List[Dict[str, Any]]) -> List[str]:
         """
@@ -136,5 +176,5 @@ class ChoiceService:
             for answer in poll.get('answers', []):
                 choice = answer.get('choice', '')
                 if choice:
-                    distinct_choices.add(choice)
+                    distinct_choices.add(sys.intern(choice))
         return list(distinct_choices)
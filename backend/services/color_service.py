@@ -2,9 +2,11 @@
 Service for computing color mappings for poll choices.
 Handles color assignment based on poll types and party affiliations.
 """
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Tuple
 from logging import Logger
 
+from models import PartyAffiliation
+
 
 class ColorService:
     """Handles color mapping computation for poll choices."""
@@ -47,6 +49,22 @@ class ColorService:
         '#17becf'   # Cyan
     ]
 
+    # Color maps for standard choice pairs, shared across calls (do not mutate)
+    _APPROVAL_MAP = {
+        'Approve': '#288544',
+        'Disapprove': '#e08728'
+    }
+
+    _FAVORABILITY_MAP = {
+        'Favorable': '#288544',
+        'Unfavorable': '#e08728'
+    }
+
+    _YESNO_MAP = {
+        'Yes': '#288544',
+        'No': '#e08728'
+    }
+
     def __init__(self, choice_service, logger: Logger):
         """
         Initialize the color service.
@@ -58,11 +76,18 @@ class ColorService:
         self.choice_service = choice_service
         self.logger = logger
 
+        # Party colors keyed by normalized party name, shared across calls
+        self._party_colors_normalized = {
+            choice_service.normalize(k): v
+            for k, v in self.PARTY_COLORS.items()
+        }
+
     async def compute_color_map(
         self,
         choices: List[str],
         poll_type: str,
-        party_affiliation_service
+        party_affiliation_service,
+        preloaded_affiliations: Optional[List[PartyAffiliation]] = None
     ) -> Dict[str, str]:
         """
         Compute color mapping for poll choices.
@@ -71,11 +96,42 @@ class ColorService:
             choices: List of choice names
             poll_type: Type of poll
             party_affiliation_service: Service for fetching party affiliations
+            preloaded_affiliations: Optional PartyAffiliation objects fetched
+                ahead of time; the service is only called for choices that
+                match none of them
 
         Returns:
             Dictionary mapping normalized choice names to hex colors
         """
-        normalized_choices = [self.choice_service.normalize(c) for c in choices]
+        # Standard pairs and primary polls need no I/O
+        if (color_map := self.try_compute_color_map_sync(choices, poll_type)) is not None:
+            return color_map
+
+        # Handle candidate polls with party affiliations
+        return await self._get_party_based_colors(
+            choices,
+            party_affiliation_service,
+            preloaded_affiliations
+        )
+
+    def try_compute_color_map_sync(
+        self,
+        choices: List[str],
+        poll_type: str
+    ) -> Optional[Dict[str, str]]:
+        """
+        Compute the color map without party affiliations, if possible.
+
+        Args:
+            choices: List of choice names
+            poll_type: Type of poll
+
+        Returns:
+            Color map for standard choice pairs or primary polls, or None if
+            party affiliations are needed
+        """
+        normalize = self.choice_service.normalize
+        normalized_choices = {normalize(c) for c in choices}
 
         # Check for standard choice pairs
         if color_map := self._get_standard_color_map(normalized_choices):
@@ -85,49 +141,46 @@ class ColorService:
         if 'primary' in poll_type.lower():
             return self._get_primary_colors(choices)
 
-        # Handle candidate polls with party affiliations
-        return await self._get_party_based_colors(
-            choices,
-            party_affiliation_service
-        )
+        return None
+
+    def needs_party_affiliations(self, choices: List[str], poll_type: str) -> bool:
+        """
+        Check whether coloring these choices requires party affiliations.
+
+        Args:
+            choices: List of choice names
+            poll_type: Type of poll
 
-    def _get_standard_color_map(self, normalized_choices: List[str]) -> Dict[str, str]:
+        Returns:
+            True if neither the standard nor the primary palette applies
+        """
+        return self.try_compute_color_map_sync(choices, poll_type) is None
+
+    def _get_standard_color_map(self, normalized_choices: Set[str]) -> Dict[str, str]:
         """
         Get color map for standard choice pairs.
 
         Args:
-            normalized_choices: List of normalized choice names
+            normalized_choices: Set of normalized choice names
 
         Returns:
-            Color map if standard pair found, None otherwise
+            Shared color map if standard pair found, None otherwise
         """
         # Party choices
         if 'Dem' in normalized_choices and 'Rep' in normalized_choices:
-            return {
-                self.choice_service.normalize(k): v
-                for k, v in self.PARTY_COLORS.items()
-            }
+            return self._party_colors_normalized
 
         # Approval choices
         if 'Approve' in normalized_choices and 'Disapprove' in normalized_choices:
-            return {
-                'Approve': '#288544',
-                'Disapprove': '#e08728'
-            }
+            return self._APPROVAL_MAP
 
         # Favorability choices
         if 'Favorable' in normalized_choices and 'Unfavorable' in normalized_choices:
-            return {
-                'Favorable': '#288544',
-                'Unfavorable': '#e08728'
-            }
+            return self._FAVORABILITY_MAP
 
         # Yes/No choices
         if 'Yes' in normalized_choices and 'No' in normalized_choices:
-            return {
-                'Yes': '#288544',
-                'No': '#e08728'
-            }
+            return self._YESNO_MAP
 
         return None
 
@@ -141,16 +194,20 @@ class ColorService:
         Returns:
             Color map with distinct colors for each choice
         """
+        normalize = self.choice_service.normalize
+        palette = self.FALLBACK_PALETTE
+        palette_size = len(palette)
+
         color_map = {}
         for idx, choice in enumerate(choices):
-            normalized = self.choice_service.normalize(choice)
-            color_map[normalized] = self.FALLBACK_PALETTE[idx % len(self.FALLBACK_PALETTE)]
+            color_map[normalize(choice)] = palette[idx % palette_size]
         return color_map
 
     async def _get_party_based_colors(
         self,
         choices: List[str],
-        party_affiliation_service
+        party_affiliation_service,
+        preloaded_affiliations: Optional[List[PartyAffiliation]] = None
     ) -> Dict[str, str]:
         """
         Get colors based on party affiliations using the service.
@@ -158,19 +215,38 @@ class ColorService:
         Args:
             choices: List of choice names
             party_affiliation_service: Service for fetching affiliations
+            preloaded_affiliations: Optional PartyAffiliation objects fetched
+                ahead of time
 
         Returns:
             Color map based on party affiliations
         """
-        # Fetch party affiliations using the service
+        # Match choices against preloaded affiliations, keyed by choice
         party_affiliations = []
-        try:
-            self.logger.info(f"Fetching party affiliations for {len(choices)} choices")
-            party_affiliations = await party_affiliation_service.get_affiliations(choices)
-            self.logger.info(f"Retrieved {len(party_affiliations)} party affiliations")
-        except Exception as e:
-            self.logger.error(f"Error getting party affiliations: {e}")
-            return self._get_primary_colors(choices)
+        missing = choices
+        if preloaded_affiliations:
+            index = self._index_affiliations(preloaded_affiliations)
+            missing = []
+            for choice in choices:
+                affiliation = self._find_affiliation(choice, preloaded_affiliations, index)
+                if affiliation:
+                    party_affiliations.append(
+                        PartyAffiliation(party=affiliation.party, person=choice)
+                    )
+                else:
+                    missing.append(choice)
+
+        # Fetch party affiliations for the remaining choices using the service
+        if missing:
+            try:
+                self.logger.info(f"Fetching party affiliations for {len(missing)} choices")
+                fetched = await party_affiliation_service.get_affiliations(missing)
+                self.logger.info(f"Retrieved {len(fetched)} party affiliations")
+                party_affiliations.extend(fetched)
+            except Exception as e:
+                self.logger.error(f"Error getting party affiliations: {e}")
+                if not party_affiliations:
+                    return self._get_primary_colors(choices)
 
         # No affiliations found
         if not party_affiliations:
@@ -199,57 +275,89 @@ class ColorService:
         rep_index = 0
         color_map = {}
 
+        # Index affiliations once rather than scanning them for every choice
+        index = self._index_affiliations(party_affiliations)
+
+        # Bind loop-invariant lookups once
+        find_affiliation = self._find_affiliation
+        normalize = self.choice_service.normalize
+        party_color = self.PARTY_COLORS.get
+        dem_palette = self.DEM_PALETTE
+        rep_palette = self.REP_PALETTE
+
         for choice in choices:
             # Find matching affiliation
-            affiliation = self._find_affiliation(choice, party_affiliations)
-            normalized_choice = self.choice_service.normalize(choice)
+            affiliation = find_affiliation(choice, party_affiliations, index)
+            normalized_choice = normalize(choice)
 
             if affiliation:
                 party = affiliation.party
                 if party == 'Dem':
-                    color_map[normalized_choice] = self.DEM_PALETTE[dem_index % len(self.DEM_PALETTE)]
+                    color_map[normalized_choice] = dem_palette[dem_index % len(dem_palette)]
                     dem_index += 1
                 elif party == 'Rep':
-                    color_map[normalized_choice] = self.REP_PALETTE[rep_index % len(self.REP_PALETTE)]
+                    color_map[normalized_choice] = rep_palette[rep_index % len(rep_palette)]
                     rep_index += 1
                 else:
-                    color_map[normalized_choice] = self.PARTY_COLORS.get(party, '#7f7f7f')
+                    color_map[normalized_choice] = party_color(party, '#7f7f7f')
             else:
                 # No affiliation, use gray
                 color_map[normalized_choice] = '#7f7f7f'
 
         return color_map
 
-    def _find_affiliation(self, choice: str, party_affiliations: List):
+    def _index_affiliations(self, party_affiliations: List) -> Tuple[Dict, Dict]:
+        """
+        Index party affiliations by exact and normalized person name.
+
+        The first affiliation listed for a name wins, as with a linear scan.
+
+        Args:
+            party_affiliations: List of PartyAffiliation objects
+
+        Returns:
+            Tuple of (affiliations by person, affiliations by lowercased
+            normalized person)
+        """
+        normalize_lower = self.choice_service.normalize_lower
+        by_exact = {}
+        by_norm = {}
+        for a in party_affiliations:
+            by_exact.setdefault(a.person, a)
+            by_norm.setdefault(normalize_lower(a.person), a)
+        return by_exact, by_norm
+
+    def _find_affiliation(
+        self,
+        choice: str,
+        party_affiliations: List,
+        index: Optional[Tuple[Dict, Dict]] = None
+    ):
         """
         Find the party affiliation for a choice.
 
         Args:
             choice: Choice name to find affiliation for
             party_affiliations: List of PartyAffiliation objects
+            index: Optional result of _index_affiliations for the same list
 
         Returns:
             Matching PartyAffiliation or None
         """
-        # Try exact match
-        affiliation = next((a for a in party_affiliations if a.person == choice), None)
-        if affiliation:
-            return affiliation
+        by_exact, by_norm = index or self._index_affiliations(party_affiliations)
 
-        # Try normalized match
-        normalized_choice = self.choice_service.normalize(choice).lower()
-        affiliation = next(
-            (a for a in party_affiliations
-             if self.choice_service.normalize(a.person).lower() == normalized_choice),
-            None
+        # Try exact match, then normalized match
+        affiliation = (
+            by_exact.get(choice)
+            or by_norm.get(self.choice_service.normalize_lower(choice))
         )
         if affiliation:
             return affiliation
 
-        # Try substring match
-        affiliation = next(
-            (a for a in party_affiliations
-             if choice.lower() in a.person.lower() or a.person.lower() in choice.lower()),
-            None
-        )
-        return affiliation
+        # Fall back to a single substring scan
+        choice_lower = choice.lower()
+        for a in party_affiliations:
+            person_lower = a.person.lower()
+            if choice_lower in person_lower or person_lower in choice_lower:
+                return a
+        return None
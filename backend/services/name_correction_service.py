@@ -1,12 +1,14 @@
 """
 Service for correcting inconsistent candidate/choice names using AI agents.
 """
-from typing import List, Dict
+import logging
+from typing import List, Dict, Optional
 from logging import Logger
 
 from agents import Agent, WebSearchTool, Runner
 from models import NameCorrectionList
-from .agent_service import AgentService
+from .agent_service import AgentService, llm_slot
+from .choice_service import ChoiceService
 
 
 class NameCorrectionService(AgentService):
@@ -19,6 +21,16 @@ class NameCorrectionService(AgentService):
     - Other naming inconsistencies in poll choices
     """
 
+    SYSTEM_PROMPT = """
+    You are a name correction agent. Your input is a comma-separated list of names.
+    You must correct the names to the correct name. All of the correct names are in
+    fact included in your input. If the difference between the names is just dots,
+    remove the dots. If you don't recognize the name, you should call your search
+    tool to acquire the results.
+
+    You must output your response in JSON format.
+    """
+
     def __init__(self, logger: Logger = None):
         """
         Initialize the name correction service.
@@ -35,21 +47,11 @@ class NameCorrectionService(AgentService):
         Returns:
             Configured Agent instance for name correction
         """
-        system_prompt = """
-        You are a name correction agent. Your input is a comma-separated list of names.
-        You must correct the names to the correct name. All of the correct names are in
-        fact included in your input. If the difference between the names is just dots,
-        remove the dots. If you don't recognize the name, you should call your search
-        tool to acquire the results.
-
-        You must output your response in JSON format.
-        """
-
         return Agent(
             name="name_correction_agent",
             model="gpt-5",
             tools=[WebSearchTool()],
-            instructions=system_prompt,
+            instructions=self.SYSTEM_PROMPT,
             output_type=NameCorrectionList,
         )
 
@@ -70,11 +72,78 @@ class NameCorrectionService(AgentService):
             self._log_info("No names provided for correction")
             return {}
 
+        # Punctuation-only variants can be resolved without the agent
+        local_corrections = self._resolve_locally(names)
+        if local_corrections is not None:
+            self._log_info(
+                f"Resolved {len(local_corrections)} name corrections locally "
+                f"for {len(names)} names"
+            )
+            return local_corrections
+
+        # Identical name sets share one lookup, sent deduplicated and sorted
+        key = tuple(sorted(set(names)))
+        corrections = await self._coalesce(key, lambda: self._lookup_corrections(list(key)))
+        return dict(corrections)
+
+    @staticmethod
+    def _resolve_locally(names: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Correct names that differ only in punctuation or surrounding whitespace.
+
+        Names are grouped by their normalized form and each group maps to its
+        shortest spelling. This only succeeds when every chosen spelling is
+        free of periods and commas; otherwise the agent is needed.
+
+        Args:
+            names: List of potentially inconsistent names
+
+        Returns:
+            Dictionary mapping incorrect names to correct names, or None if
+            the names need the agent
+        """
+        groups = {}
+        for name in names:
+            groups.setdefault(ChoiceService.normalize(name), []).append(name)
+
+        canonical = {}
+        for normalized, group in groups.items():
+            name = min(group, key=len)
+            if '.' in name or ',' in name:
+                return None
+            canonical[normalized] = name
+
+        return {
+            name: canonical[normalized]
+            for normalized, group in groups.items()
+            for name in group
+            if name != canonical[normalized]
+        }
+
+    async def _lookup_corrections(self, names: List[str]) -> Dict[str, str]:
+        """
+        Invoke the agent to correct names.
+
+        Args:
+            names: List of potentially inconsistent names
+
+        Returns:
+            Dictionary mapping incorrect names to correct names
+
+        Raises:
+            Exception: If agent invocation fails
+        """
         try:
             self._log_info(f"Getting name corrections for {len(names)} names")
 
             # Invoke agent with comma-separated names
-            agent_result = await Runner.run(self.agent, ','.join(names))
+            async with llm_slot():
+                agent_result = await Runner.run(self.agent, ','.join(names))
+            usage = agent_result.context_wrapper.usage
+            self._log_prompt_cache_usage(
+                usage.input_tokens,
+                usage.input_tokens_details.cached_tokens
+            )
 
             # Extract corrections from structured output
             corrections_list = agent_result.final_output.name_corrections
@@ -88,9 +157,10 @@ class NameCorrectionService(AgentService):
             self._log_info(f"Received {len(corrections_map)} name corrections")
 
             # Log specific corrections for debugging
-            for incorrect, correct in corrections_map.items():
-                if incorrect != correct:
-                    self._log_info(f"Correcting '{incorrect}' → '{correct}'")
+            if self._is_enabled_for(logging.DEBUG):
+                for incorrect, correct in corrections_map.items():
+                    if incorrect != correct:
+                        self._log_debug(f"Correcting '{incorrect}' → '{correct}'")
 
             return corrections_map
 
@@ -98,6 +168,40 @@ class NameCorrectionService(AgentService):
             self._log_error(f"Error getting name corrections: {e}")
             raise
 
+    async def get_corrections_batched(
+        self,
+        groups: Dict[str, List[str]]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Get name corrections for several groups of names with a single call.
+
+        Names are deduplicated across groups before the agent is invoked,
+        and the resulting corrections are scattered back to each group.
+
+        Args:
+            groups: Mapping of group keys (e.g. divisions) to their names
+
+        Returns:
+            Dictionary mapping each group key to its corrections map
+
+        Raises:
+            Exception: If agent invocation fails
+        """
+        all_names = set().union(*groups.values())
+        if not all_names:
+            return {key: {} for key in groups}
+
+        self._log_info(
+            f"Deduplicated {sum(len(names) for names in groups.values())} names "
+            f"across {len(groups)} groups to {len(all_names)}"
+        )
+        corrections = await self.get_corrections(sorted(all_names))
+
+        return {
+            key: {name: corrections[name] for name in names if name in corrections}
+            for key, names in groups.items()
+        }
+
     async def apply_corrections_to_choices(
         self,
         choices: List[str]
@@ -115,8 +219,8 @@ class NameCorrectionService(AgentService):
         corrections = await self.get_corrections(choices)
 
         # Build complete mapping (including identity mappings)
-        complete_mapping = {}
-        for choice in choices:
-            complete_mapping[choice] = corrections.get(choice, choice)
+        if not corrections:
+            return {choice: choice for choice in choices}
 
-        return complete_mapping
+        get_correction = corrections.get
+        return {choice: get_correction(choice, choice) for choice in choices}
@@ -1,12 +1,14 @@
 """
 Service for determining party affiliations of political candidates using AI agents.
 """
-from typing import List
+import logging
+from collections import Counter, defaultdict
+from typing import List, Dict
 from logging import Logger
 
 from agents import Agent, WebSearchTool, Runner
 from models import PartyAffiliation, PartyAffiliationList
-from .agent_service import AgentService
+from .agent_service import AgentService, llm_slot
 
 
 class PartyAffiliationService(AgentService):
@@ -26,6 +28,23 @@ class PartyAffiliationService(AgentService):
     - Unknown (cannot be determined)
     """
 
+    SYSTEM_PROMPT = """
+    You are a calculator of party affiliations. Your input is a comma-separated
+    list of names. You must calculate the party affiliation of each person
+    supplied to you. If a person's party affiliation is not in your data, you
+    should call your search tool to acquire the results. If you can't determine
+    the party affiliation, answer 'Unknown'.
+
+    Answer 'Dem' for Democrat, 'Rep' for Republican, 'Ind' for Independent,
+    'Lib' for Libertarian, 'Green' for Green, 'Other' for any other party.
+    If you cannot determine the party affiliation, answer 'Unknown'.
+
+    You must output your response in JSON format.
+    """
+
+    # Maximum number of names included in a log message
+    LOG_NAMES_LIMIT = 20
+
     def __init__(self, logger: Logger = None):
         """
         Initialize the party affiliation service.
@@ -42,25 +61,11 @@ class PartyAffiliationService(AgentService):
         Returns:
             Configured Agent instance for party affiliation lookup
         """
-        system_prompt = """
-        You are a calculator of party affiliations. Your input is a comma-separated
-        list of names. You must calculate the party affiliation of each person
-        supplied to you. If a person's party affiliation is not in your data, you
-        should call your search tool to acquire the results. If you can't determine
-        the party affiliation, answer 'Unknown'.
-
-        Answer 'Dem' for Democrat, 'Rep' for Republican, 'Ind' for Independent,
-        'Lib' for Libertarian, 'Green' for Green, 'Other' for any other party.
-        If you cannot determine the party affiliation, answer 'Unknown'.
-
-        You must output your response in JSON format.
-        """
-
         return Agent(
             name="party_affiliation_agent",
             model="gpt-5",
             tools=[WebSearchTool()],
-            instructions=system_prompt,
+            instructions=self.SYSTEM_PROMPT,
             output_type=PartyAffiliationList,
         )
 
@@ -81,13 +86,43 @@ class PartyAffiliationService(AgentService):
             self._log_info("No names provided for party affiliation lookup")
             return []
 
+        # Identical candidate sets share one lookup, sent deduplicated and sorted
+        key = tuple(sorted(set(names)))
+        affiliations = await self._coalesce(key, lambda: self._lookup_affiliations(list(key)))
+        return list(affiliations)
+
+    async def _lookup_affiliations(self, names: List[str]) -> List[PartyAffiliation]:
+        """
+        Invoke the agent to look up party affiliations.
+
+        Args:
+            names: List of candidate/person names
+
+        Returns:
+            List of PartyAffiliation objects
+
+        Raises:
+            Exception: If agent invocation fails
+        """
+        log_info = self._is_enabled_for(logging.INFO)
+
         try:
-            self._log_info(
-                f"Fetching party affiliations for {len(names)} names: {names}"
-            )
+            if log_info:
+                shown = ', '.join(names[:self.LOG_NAMES_LIMIT])
+                if len(names) > self.LOG_NAMES_LIMIT:
+                    shown += ', ...'
+                self._log_info(
+                    f"Fetching party affiliations for {len(names)} names: {shown}"
+                )
 
             # Invoke agent with comma-separated names
-            agent_result = await Runner.run(self.agent, ','.join(names))
+            async with llm_slot():
+                agent_result = await Runner.run(self.agent, ','.join(names))
+            usage = agent_result.context_wrapper.usage
+            self._log_prompt_cache_usage(
+                usage.input_tokens,
+                usage.input_tokens_details.cached_tokens
+            )
 
             # Extract affiliations from structured output
             affiliations = agent_result.final_output.party_affiliations
@@ -95,10 +130,11 @@ class PartyAffiliationService(AgentService):
             self._log_info(f"Retrieved {len(affiliations)} party affiliations")
 
             # Log affiliations for debugging
-            for affiliation in affiliations:
-                self._log_info(
-                    f"Party affiliation: {affiliation.person} → {affiliation.party}"
-                )
+            if log_info:
+                for affiliation in affiliations:
+                    self._log_info(
+                        f"Party affiliation: {affiliation.person} → {affiliation.party}"
+                    )
 
             return affiliations
 
@@ -123,6 +159,26 @@ class PartyAffiliationService(AgentService):
             for affiliation in affiliations
         }
 
+    async def get_affiliations_batched(self, names: List[str]) -> List[PartyAffiliation]:
+        """
+        Get party affiliations for names gathered from several polls at once.
+
+        Duplicate names are removed so each person is looked up only once.
+        The agent may spell names differently from the input, so callers
+        should match choices against the result rather than key on it.
+
+        Args:
+            names: List of candidate/person names, possibly with duplicates
+
+        Returns:
+            List of PartyAffiliation objects
+        """
+        unique_names = list(dict.fromkeys(names))
+        self._log_info(
+            f"Batching party affiliation lookup for {len(unique_names)} unique names"
+        )
+        return await self.get_affiliations(unique_names)
+
     def filter_by_party(
         self,
         affiliations: List[PartyAffiliation],
@@ -144,6 +200,25 @@ class PartyAffiliationService(AgentService):
             if affiliation.party == party
         ]
 
+    def group_by_party(self, affiliations: List[PartyAffiliation]) -> Dict[str, List[str]]:
+        """
+        Group person names by party in a single pass.
+
+        Prefer this over repeated filter_by_party calls when several
+        parties are needed.
+
+        Args:
+            affiliations: List of PartyAffiliation objects
+
+        Returns:
+            Dictionary mapping party names to the people belonging to them
+        """
+        groups = defaultdict(list)
+        for affiliation in affiliations:
+            groups[affiliation.party].append(affiliation.person)
+
+        return dict(groups)
+
     def count_by_party(self, affiliations: List[PartyAffiliation]) -> dict:
         """
         Count affiliations by party.
@@ -154,9 +229,4 @@ class PartyAffiliationService(AgentService):
         Returns:
             Dictionary mapping party names to counts
         """
-        counts = {}
-        for affiliation in affiliations:
-            party = affiliation.party
-            counts[party] = counts.get(party, 0) + 1
-
-        return counts
+        return dict(Counter(affiliation.party for affiliation in affiliations))
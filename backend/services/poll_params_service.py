@@ -1,12 +1,18 @@
 """
 Service for converting natural language queries to VoteHub API parameters using AI agents.
 """
-from typing import Dict, Any
+import hashlib
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Tuple
 from logging import Logger
 
+from cachetools import TTLCache
 from langchain.agents import create_agent
 from models import VoteHubRequestParams
 from tools import (
+    get_catalog_bundle,
     get_supported_poll_types,
     get_supported_pollsters,
     get_poll_subjects,
@@ -15,6 +21,22 @@ from tools import (
 )
 from .agent_service import AgentService
 
+# "last 3 months", "past week", "last 10 days", ... A count is required for
+# days, since "last day" usually means something else ("last day of polling")
+_RELATIVE_DATE_RE = re.compile(
+    r'\b(?:last|past)\s+(?:(\d+)\s+(day|week|month|year)s?|(week|month|year))\b',
+    re.IGNORECASE
+)
+
+# "in March", "during August", ... Only these bounded phrases are resolved:
+# "since"/"from" are open-ended, and a following year ("in January 2023")
+# is left to the agent since get_month_range_by_name assumes the latest one
+_MONTH_RE = re.compile(
+    r'\b(?:in|during)\s+(january|february|march|april|may|june|july|august|'
+    r'september|october|november|december)\b(?!,?\s*\d{4})',
+    re.IGNORECASE
+)
+
 
 class PollParamsService(AgentService):
     """
@@ -30,14 +52,52 @@ class PollParamsService(AgentService):
     }
     """
 
-    def __init__(self, logger: Logger = None):
+    SYSTEM_PROMPT = """
+    You are a calculator of request parameters for the VoteHub API. You must
+    calculate one or more of the following parameters (using tools as needed):
+
+    Prefer calling get_catalog_bundle once to get the output of
+    get_poll_subjects, get_supported_pollsters and get_supported_poll_types
+    together, instead of calling those tools one by one.
+
+    * subject and poll_type (Use get_poll_subjects to get possible values to
+      cross-reference; first use the subject field from the tool's output for
+      the subject parameter, then use the poll_types field from the tool's
+      output for the poll_type parameter. The poll_type parameter has to be
+      one of the supported poll types that corresponds to the selected subject.
+      It is also possible that the query only specifies a poll_type, in which
+      case you should use the poll_type parameter without the subject parameter.)
+    * pollster (Use get_supported_pollsters to get possible values to
+      cross-reference; it could be a partial match)
+    * from_date (Use date_n_units_ago or get_month_range_by_name to get
+      possible values to cross-reference)
+    * to_date (Use date_n_units_ago or get_month_range_by_name to get
+      possible values to cross-reference)
+    * min_sample_size (in integer format)
+    * population (e.g. rv – registered voters, lv – likely voters, a – all voters)
+
+    The query may be followed by a "Resolved:" line with dates precomputed
+    for some of its phrases. Treat them as hints: use them when they match
+    what the query asks for, but if the rest of the query says otherwise
+    (e.g. an explicit year or an open-ended range), follow the query and
+    use the date tools instead.
+
+    You must output your response in JSON format. The response must be a valid
+    JSON object and must be a valid VoteHubRequestParams object.
+    """
+
+    def __init__(self, logger: Logger = None, cache_ttl: int = 3600, cache_size: int = 2048):
         """
         Initialize the poll params service.
 
         Args:
             logger: Logger instance for operation logging
+            cache_ttl: Seconds an extracted parameter set stays cached
+            cache_size: Maximum number of cached queries
         """
         super().__init__(logger)
+        self._params_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._params_cache_lock = threading.Lock()
 
     def _create_agent(self):
         """
@@ -46,40 +106,20 @@ class PollParamsService(AgentService):
         Returns:
             Configured agent instance for parameter extraction
         """
-        system_prompt = """
-        You are a calculator of request parameters for the VoteHub API. You must
-        calculate one or more of the following parameters (using tools as needed):
-
-        * subject and poll_type (Use get_poll_subjects to get possible values to
-          cross-reference; first use the subject field from the tool's output for
-          the subject parameter, then use the poll_types field from the tool's
-          output for the poll_type parameter. The poll_type parameter has to be
-          one of the supported poll types that corresponds to the selected subject.
-          It is also possible that the query only specifies a poll_type, in which
-          case you should use the poll_type parameter without the subject parameter.)
-        * pollster (Use get_supported_pollsters to get possible values to
-          cross-reference; it could be a partial match)
-        * from_date (Use date_n_units_ago or get_month_range_by_name to get
-          possible values to cross-reference)
-        * to_date (Use date_n_units_ago or get_month_range_by_name to get
-          possible values to cross-reference)
-        * min_sample_size (in integer format)
-        * population (e.g. rv – registered voters, lv – likely voters, a – all voters)
-
-        You must output your response in JSON format. The response must be a valid
-        JSON object and must be a valid VoteHubRequestParams object.
-        """
-
         return create_agent(
             model="gpt-5",
-            tools=[
-                get_supported_poll_types,
-                get_poll_subjects,
-                get_supported_pollsters,
-                date_n_units_ago,
-                get_month_range_by_name
-            ],
-            system_prompt=system_prompt,
+            tools=sorted(
+                [
+                    get_catalog_bundle,
+                    get_supported_poll_types,
+                    get_poll_subjects,
+                    get_supported_pollsters,
+                    date_n_units_ago,
+                    get_month_range_by_name
+                ],
+                key=lambda t: t.name
+            ),
+            system_prompt=self.SYSTEM_PROMPT,
             response_format=VoteHubRequestParams,
         )
 
@@ -87,39 +127,157 @@ class PollParamsService(AgentService):
         """
         Extract VoteHub API parameters from a natural language query.
 
+        Results are cached in-process per normalized query, so repeat
+        queries skip the agent call entirely.
+
         Args:
             user_query: Natural language query from user
 
         Returns:
             VoteHubRequestParams object with extracted parameters
 
+        Raises:
+            Exception: If agent invocation fails
+        """
+        params, _ = self._extract_with_dump(user_query)
+        return params.model_copy()
+
+    def _extract_with_dump(self, user_query: str) -> Tuple[VoteHubRequestParams, Dict[str, Any]]:
+        """
+        Extract parameters along with their dump, both cached per query.
+
+        Args:
+            user_query: Natural language query from user
+
+        Returns:
+            Tuple of (shared VoteHubRequestParams, shared dump excluding None
+            values); callers must copy before handing either out
+
         Raises:
             Exception: If agent invocation fails
         """
         if not user_query or not user_query.strip():
             self._log_warning("Empty query provided")
-            return VoteHubRequestParams()
+            return VoteHubRequestParams(), {}
+
+        cache_key = self._params_cache_key(user_query)
+        with self._params_cache_lock:
+            cached = self._params_cache.get(cache_key)
+
+        if cached is not None:
+            self._log_info(f"Params cache hit for query: '{user_query}'")
+            return cached
+
+        self._log_info(f"Params cache miss for query: '{user_query}'")
+        extracted = self._extract_impl(user_query)
+
+        with self._params_cache_lock:
+            self._params_cache[cache_key] = extracted
+
+        return extracted
+
+    @staticmethod
+    def _resolve_dates(user_query: str) -> List[str]:
+        """
+        Resolve common relative date phrases in a query without the agent.
+
+        Handles "last/past N days/weeks/months/years", "last/past
+        week/month/year" and "in/during <month>" (without a year), using
+        the same tools the agent would otherwise call. Phrases the tools
+        cannot resolve (e.g. "last 3000 years") are left to the agent.
+
+        Args:
+            user_query: Natural language query from user
+
+        Returns:
+            Descriptions of resolved date ranges, e.g.
+            "'last month' -> from_date=2024-10-14, to_date=2024-11-14"
+        """
+        resolved = []
 
+        for match in _RELATIVE_DATE_RE.finditer(user_query):
+            n = int(match.group(1) or 1)
+            unit = (match.group(2) or match.group(3)).lower()
+            try:
+                from_date = date_n_units_ago.invoke({'n': n, 'unit': unit})
+                to_date = date_n_units_ago.invoke({'n': 0, 'unit': 'day'})
+            except (ValueError, OverflowError):
+                continue
+            resolved.append(
+                f"'{match.group(0)}' -> from_date={from_date}, to_date={to_date}"
+            )
+
+        for match in _MONTH_RE.finditer(user_query):
+            month = match.group(1)
+            try:
+                month_range = get_month_range_by_name.invoke({'month_name': month})
+            except (ValueError, OverflowError):
+                continue
+            resolved.append(
+                f"'{month}' -> from_date={month_range['start_date']}, "
+                f"to_date={month_range['end_date']}"
+            )
+
+        return resolved
+
+    def _extract_impl(self, user_query: str) -> Tuple[VoteHubRequestParams, Dict[str, Any]]:
+        """
+        Invoke the agent to extract parameters from a query.
+
+        Args:
+            user_query: Natural language query from user
+
+        Returns:
+            Tuple of (VoteHubRequestParams, its dump excluding None values)
+
+        Raises:
+            Exception: If agent invocation fails
+        """
         try:
             self._log_info(f"Extracting params from query: '{user_query}'")
 
+            # Pre-resolve date phrases so the agent can skip the date tools
+            content = user_query
+            resolved_dates = self._resolve_dates(user_query)
+            if resolved_dates:
+                content = f"{user_query}\n\nResolved: {'; '.join(resolved_dates)}"
+                self._log_info(f"Pre-resolved dates: {resolved_dates}")
+
             # Invoke agent with user query
             result = self.agent.invoke({
-                "messages": [{"role": "user", "content": user_query}]
+                "messages": [{"role": "user", "content": content}]
             })
 
             # Extract structured response
             params = result['structured_response']
+            self._log_message_cache_usage(result['messages'])
 
             # Log extracted parameters
-            self._log_info(f"Extracted parameters: {params.model_dump(exclude_none=True)}")
+            dump = params.model_dump(exclude_none=True)
+            self._log_info(f"Extracted parameters: {dump}")
 
-            return params
+            return params, dump
 
         except Exception as e:
             self._log_error(f"Error extracting poll params: {e}")
             raise
 
+    def _log_message_cache_usage(self, messages: list):
+        """
+        Sum token usage across an agent run's messages and log cache reads.
+
+        Args:
+            messages: Messages returned by the agent invocation
+        """
+        input_tokens = 0
+        cached_tokens = 0
+        for message in messages:
+            usage = getattr(message, 'usage_metadata', None)
+            if usage:
+                input_tokens += usage.get('input_tokens', 0)
+                cached_tokens += usage.get('input_token_details', {}).get('cache_read', 0)
+        self._log_prompt_cache_usage(input_tokens, cached_tokens)
+
     def extract_params_as_dict(self, user_query: str) -> Dict[str, Any]:
         """
         Extract VoteHub API parameters as a dictionary.
@@ -130,10 +288,26 @@ class PollParamsService(AgentService):
         Returns:
             Dictionary of parameters (excluding None values)
         """
-        params = self.extract_params(user_query)
-        return {
-            k: v for k, v in params.model_dump(exclude_none=True).items()
-        }
+        _, dump = self._extract_with_dump(user_query)
+        return dict(dump)
+
+    @staticmethod
+    def _params_cache_key(user_query: str) -> str:
+        """
+        Build the cache key for a user query.
+
+        The query is lowercased with whitespace collapsed, and today's UTC
+        date is included so relative dates ("last month") are re-resolved daily.
+
+        Args:
+            user_query: Natural language query from user
+
+        Returns:
+            SHA-256 hex digest identifying the query
+        """
+        normalized = ' '.join(user_query.lower().split())
+        today = datetime.now(timezone.utc).date().isoformat()
+        return hashlib.sha256(f"{today}:{normalized}".encode()).hexdigest()
 
     def validate_params(self, params: VoteHubRequestParams) -> bool:
         """
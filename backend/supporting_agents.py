@@ -1,14 +1,38 @@
 from typing import List
 from langchain.agents import create_agent
+import asyncio
 import os
+from functools import lru_cache
+from cachetools import TTLCache
 from models import NameCorrectionList, PartyAffiliationList, VoteHubRequestParams
-from tools import get_supported_poll_types, get_supported_pollsters, get_poll_subjects, date_n_units_ago, get_month_range_by_name, make_api_call
+from tools import get_catalog_bundle, get_supported_poll_types, get_supported_pollsters, get_poll_subjects, date_n_units_ago, get_month_range_by_name, make_api_call
 from agents import Agent, WebSearchTool, Runner
+from util import normalize_choice
+from services.agent_service import coalesce_call, llm_slot
 
+# Agent results are cached for a day, keyed by the set of names asked about
+_AGENT_CACHE_TTL = 24 * 60 * 60
+_AGENT_CACHE_SIZE = 1024
+_affiliation_cache = TTLCache(maxsize=_AGENT_CACHE_SIZE, ttl=_AGENT_CACHE_TTL)
+_correction_cache = TTLCache(maxsize=_AGENT_CACHE_SIZE, ttl=_AGENT_CACHE_TTL)
+_affiliation_inflight = {}
+_correction_inflight = {}
+
+async def _run_agent(agent, agent_input: str):
+    """
+    Run an agent while holding a slot of the LLM semaphore shared with the
+    agent services, so all agent runs count against one LLM_CONCURRENCY budget.
+    """
+    async with llm_slot():
+        return await Runner.run(agent, agent_input)
+
+@lru_cache(maxsize=1)
 def create_poll_params_agent():
     system_prompt = """
     You are a calculator of request parameters for the VoteHub API. You must calculate one or more of the following parameters (using tools as needed):
 
+    Prefer calling get_catalog_bundle once to get the output of get_poll_subjects, get_supported_pollsters and get_supported_poll_types together, instead of calling those tools one by one.
+
     * subject and poll_type (Use get_poll_subjects to get possible values to cross-reference; first use the subject field from the tool's output for the subject parameter, then use the poll_types field from the tool's output for the poll_type parameter. The poll_type parameter has to be one of the supported poll types that corresponds to the selected subject. It is also possible that the query only specifies a poll_type, in which case you should use the poll_type parameter without the subject parameter.)
     * pollster (Use get_supported_pollsters to get possible values to cross-reference; it could be a partial match)
     * from_date (Use date_n_units_ago or get_month_range_by_name to get possible values to cross-reference)
@@ -19,11 +43,12 @@ def create_poll_params_agent():
     """
     return create_agent(
         model="gpt-5",
-        tools=[get_supported_poll_types, get_poll_subjects, get_supported_pollsters, date_n_units_ago, get_month_range_by_name],
+        tools=[get_catalog_bundle, get_supported_poll_types, get_poll_subjects, get_supported_pollsters, date_n_units_ago, get_month_range_by_name],
         system_prompt=system_prompt,
         response_format=VoteHubRequestParams,
     )
 
+@lru_cache(maxsize=1)
 def create_party_affiliation_agent():
     system_prompt = """
     You are a calculator of party affiliations. Your input is a comma-separated list of names. You must calculate the party affiliation of each person supplied to you. If a person's party affiliation is not in your data, you should call your search tool to acquire the results. If you can't determine the party affiliation, answer 'Unknown'.
@@ -41,10 +66,33 @@ def create_party_affiliation_agent():
         output_type=PartyAffiliationList,
     )
 
-async def get_party_affiliations(choices: List[str]):
-    agent_result = await Runner.run(create_party_affiliation_agent(), ','.join(choices))
+# Large ballots are looked up in concurrent chunks of this many names
+AFFILIATION_BATCH_SIZE = int(os.getenv('AFFILIATION_BATCH_SIZE', '20'))
+AFFILIATION_CONCURRENCY = int(os.getenv('AFFILIATION_CONCURRENCY', '4'))
+_affiliation_sem = None
+
+async def _run_affiliation_chunk(chunk: List[str]):
+    global _affiliation_sem
+    if _affiliation_sem is None:
+        _affiliation_sem = asyncio.Semaphore(AFFILIATION_CONCURRENCY)
+
+    async with _affiliation_sem:
+        agent_result = await _run_agent(create_party_affiliation_agent(), ','.join(chunk))
     return agent_result.final_output.party_affiliations
 
+async def get_party_affiliations(choices: List[str]):
+    async def call():
+        chunks = [
+            choices[i:i + AFFILIATION_BATCH_SIZE]
+            for i in range(0, len(choices), AFFILIATION_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(_run_affiliation_chunk(chunk) for chunk in chunks))
+        return [affiliation for result in results for affiliation in result]
+
+    key = tuple(sorted(set(normalize_choice(c).lower() for c in choices)))
+    return list(await coalesce_call(_affiliation_cache, _affiliation_inflight, key, call))
+
+@lru_cache(maxsize=1)
 def create_name_correction_agent():
     system_prompt = """
     You are a name correction agent. Your input is a comma-separated list of names. You must correct the names to the correct name. All of the correct names are in fact included in your input. If the difference between the names is just dots, remove the dots. If you don't recognize the name, you should call your search tool to acquire the results.
@@ -60,5 +108,20 @@ def create_name_correction_agent():
     )
 
 async def get_name_corrections(names: List[str]):
-    agent_result = await Runner.run(create_name_correction_agent(), ','.join(names))
-    return agent_result.final_output.name_corrections
+    async def call():
+        agent_result = await _run_agent(create_name_correction_agent(), ','.join(names))
+        return agent_result.final_output.name_corrections
+
+    key = tuple(sorted(set(names)))
+    return list(await coalesce_call(_correction_cache, _correction_inflight, key, call))
+
+async def get_affiliations_and_corrections(choices: List[str]):
+    """
+    Look up party affiliations and name corrections for the same choices,
+    running both agents concurrently.
+    Returns a (party_affiliations, name_corrections) tuple.
+    """
+    return tuple(await asyncio.gather(
+        get_party_affiliations(choices),
+        get_name_corrections(choices)
+    ))
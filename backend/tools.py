@@ -1,23 +1,96 @@
 from langchain.tools import tool
 from datetime import datetime, timedelta, timezone
 import calendar
+import functools
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
 from typing import Dict
 from util import make_api_call
 
+_cache_clears = []
+
+def ttl_cache(ttl: float):
+    """
+    Cache a function's results per positional arguments for ttl seconds.
+    Thread-safe, since agent tools may run from worker threads.
+    """
+    def decorator(func):
+        entries = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = func(*args)
+            with lock:
+                entries[args] = (now + ttl, value)
+            return value
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        _cache_clears.append(cache_clear)
+        return wrapper
+
+    return decorator
+
+def clear_cache():
+    """Drop every entry cached by ttl_cache."""
+    for cache_clear in _cache_clears:
+        cache_clear()
+
+@ttl_cache(ttl=900)
+def _cached_get(url: str):
+    return make_api_call(url)
+
+def _catalog_get(url: str):
+    """
+    Fetch a catalog through the cache. Error responses raise out of
+    _cached_get, so they are never cached; their body is handed to the
+    agent as before.
+    """
+    try:
+        return _cached_get(url)
+    except httpx.HTTPStatusError as e:
+        return e.response.json()
+
 @tool
 def get_supported_pollsters():
     """Get the pollsters that are supported and available"""
-    return make_api_call("https://api.votehub.com/pollsters")
+    return _catalog_get("https://api.votehub.com/pollsters")
 
 @tool
 def get_supported_poll_types():
     """Get the poll types that are supported and available"""
-    return make_api_call("https://api.votehub.com/poll-types")
+    return _catalog_get("https://api.votehub.com/poll-types")
 
 @tool
 def get_poll_subjects():
     """Get a list of subjects with their associated poll types, including covered races, approvals, favorabilities, and generic ballot. This shows which subjects can be used with different poll types."""
-    return make_api_call("https://api.votehub.com/subjects")
+    return _catalog_get("https://api.votehub.com/subjects")
+
+_CATALOG_URLS = {
+    "subjects": "https://api.votehub.com/subjects",
+    "pollsters": "https://api.votehub.com/pollsters",
+    "poll_types": "https://api.votehub.com/poll-types",
+}
+
+@tool
+def get_catalog_bundle():
+    """Get the poll subjects (with their associated poll types), the supported pollsters, and the supported poll types in a single call. Returns {"subjects": ..., "pollsters": ..., "poll_types": ...}, the same data as get_poll_subjects, get_supported_pollsters, and get_supported_poll_types."""
+    # Fetch the three catalogs concurrently so the call takes max() rather than sum() of their latencies
+    with ThreadPoolExecutor(max_workers=len(_CATALOG_URLS)) as executor:
+        futures = {name: executor.submit(_catalog_get, url) for name, url in _CATALOG_URLS.items()}
+        return {name: future.result() for name, future in futures.items()}
 
 @tool
 def date_n_units_ago(n: int, unit: str) -> str:
@@ -35,39 +108,31 @@ def date_n_units_ago(n: int, unit: str) -> str:
     elif unit == "week":
         result = today - timedelta(weeks=n)
     elif unit == "month":
-        # If today is 31st and target month doesn't have 31, fallback to last day of target month
-        year = today.year
-        month = today.month - n
-        while month <= 0:
-            month += 12
-            year -= 1
-        day = today.day
-        # Calculate last day in the target month
-        last_day = 28
-        for d in (31, 30, 29, 28):
-            try:
-                datetime(year, month, d)
-                last_day = d
-                break
-            except ValueError:
-                continue
-        if day > last_day:
-            day = last_day
+        # Step back n months in closed form; if today is the 31st and the
+        # target month is shorter, clamp to the target month's last day
+        total = today.month - 1 - n
+        year = today.year + total // 12
+        month = total % 12 + 1
+        day = min(today.day, calendar.monthrange(year, month)[1])
         result = datetime(year, month, day).date()
     elif unit == "year":
         year = today.year - n
         month = today.month
         day = today.day
-        # Handle leap year case (Feb 29)
-        try:
-            result = datetime(year, month, day).date()
-        except ValueError:
-            # fallback to Feb 28 if not a leap year
-            result = datetime(year, month, 28).date()
+        # Handle leap year case (Feb 29): fall back to Feb 28 if not a leap year
+        if month == 2 and day == 29 and not calendar.isleap(year):
+            day = 28
+        result = datetime(year, month, day).date()
     else:
         raise ValueError("Unit must be one of: 'day', 'week', 'month', 'year'.")
     return result.strftime("%Y-%m-%d")
 
+# Lowercased full and abbreviated month names mapped to month numbers
+_MONTH_LOOKUP = {
+    **{month.lower(): i for i, month in enumerate(calendar.month_name) if month},
+    **{month.lower(): i for i, month in enumerate(calendar.month_abbr) if month},
+}
+
 @tool
 def get_month_range_by_name(month_name: str) -> Dict[str, str]:
     """
@@ -90,15 +155,10 @@ def get_month_range_by_name(month_name: str) -> Dict[str, str]:
     month_name = month_name.strip().lower()
 
     # Map input to month number, supports abbreviations and full names
-    month_lookup = {month.lower(): i for i, month in enumerate(calendar.month_name) if month}
-    month_abbr_lookup = {month.lower(): i for i, month in enumerate(calendar.month_abbr) if month}
-    lookup = {**month_lookup, **month_abbr_lookup}
-
-    if month_name not in lookup:
+    month_num = _MONTH_LOOKUP.get(month_name)
+    if month_num is None:
         raise ValueError(f"Invalid month name: '{month_name}'")
 
-    month_num = lookup[month_name]
-
     # Figure out which year to use: most recent occurrence of that month (<= today)
     if today.month < month_num:
         year = today.year - 1
@@ -108,15 +168,8 @@ def get_month_range_by_name(month_name: str) -> Dict[str, str]:
     start_date = datetime(year, month_num, 1).date()
 
     # Figure out the last valid day in the month
-    if month_num == 12:
-        next_month = 1
-        next_year = year + 1
-    else:
-        next_month = month_num + 1
-        next_year = year
-
-    first_of_next_month = datetime(next_year, next_month, 1).date()
-    last_date = first_of_next_month - timedelta(days=1)
+    last_day = calendar.monthrange(year, month_num)[1]
+    last_date = datetime(year, month_num, last_day).date()
 
     return {
         "start_date": start_date.strftime("%Y-%m-%d"),
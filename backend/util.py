@@ -1,17 +1,123 @@
-import requests
+import atexit
+import httpx
+from functools import lru_cache
 from typing import Dict, List
-import asyncio
+
+# Pooled client shared by all tool calls, so keep-alive connections are reused
+_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+    timeout=10
+)
+atexit.register(_client.close)
 
 def make_api_call(url):
-    response = requests.get(url)
+    response = _client.get(url)
+    response.raise_for_status()
     return response.json()
 
+# Characters stripped by normalize_choice, removed in a single translate pass
+_STRIP_TABLE = str.maketrans('', '', '.,')
+
+@lru_cache(maxsize=4096)
 def normalize_choice(choice: str) -> str:
     """
     Normalize choice names by removing periods, commas, and extra whitespace.
     Matches the frontend normalization logic.
     """
-    return choice.replace('.', '').replace(',', '').strip()
+    return choice.translate(_STRIP_TABLE).strip()
+
+# Hardcoded color maps for common poll types (shared, do not mutate)
+_PARTY_COLOR_MAP = {
+    normalize_choice('Dem'): '#2563eb',
+    normalize_choice('Rep'): '#e02f28',
+    normalize_choice('Lib'): '#c4b937',
+    normalize_choice('Green'): '#288544',
+    normalize_choice('Other'): '#7f7f7f'
+}
+
+_APPROVAL_COLOR_MAP = {
+    normalize_choice('Approve'): '#288544',
+    normalize_choice('Disapprove'): '#e08728'
+}
+
+_FAVORABILITY_COLOR_MAP = {
+    normalize_choice('Favorable'): '#288544',
+    normalize_choice('Unfavorable'): '#e08728'
+}
+
+_YES_NO_COLOR_MAP = {
+    normalize_choice('Yes'): '#288544',
+    normalize_choice('No'): '#e08728'
+}
+
+# Standard choice pairs, checked in order, and the color map each one selects
+_STANDARD_COLOR_MAPS = [
+    (frozenset({'Dem', 'Rep'}), _PARTY_COLOR_MAP),
+    (frozenset({'Approve', 'Disapprove'}), _APPROVAL_COLOR_MAP),
+    (frozenset({'Favorable', 'Unfavorable'}), _FAVORABILITY_COLOR_MAP),
+    (frozenset({'Yes', 'No'}), _YES_NO_COLOR_MAP)
+]
+
+# Colorblind-friendly categorical colors (Tableau 10)
+PRIMARY_PALETTE = [
+    '#1f77b4',  # Blue
+    '#ff7f0e',  # Orange
+    '#2ca02c',  # Green
+    '#d62728',  # Red
+    '#9467bd',  # Purple
+    '#8c564b',  # Brown
+    '#e377c2',  # Pink
+    '#7f7f7f',  # Gray
+    '#bcbd22',  # Olive
+    '#17becf'   # Cyan
+]
+
+# Extended color palettes for Dems and Reps
+PARTY_PALETTES = {
+    'Dem': [
+        '#2563eb',  # Original Dem blue
+        '#3b82f6',  # Lighter blue
+        '#1d4ed8',  # Darker blue
+        '#60a5fa',  # Even lighter blue
+        '#1e40af'   # Even darker blue
+    ],
+    'Rep': [
+        '#e02f28',  # Original Rep red
+        '#f87171',  # Lighter red
+        '#b91c1c',  # Darker red
+        '#fb7185',  # Even lighter red/pinkish
+        '#991b1b'   # Even darker red
+    ]
+}
+
+# Default fallback for other parties
+DEFAULT_PARTY_COLORS = {
+    'Ind': '#eab308',  # yellow-ish for Independent
+    'Other': '#7c3aed'
+}
+
+def _palette_map(choices: List[str], palette: List[str]) -> Dict[str, str]:
+    """
+    Map each normalized choice to a palette color, cycling through the palette.
+    """
+    color_map = {}
+    for idx, choice in enumerate(choices):
+        color_map[normalize_choice(choice)] = palette[idx % len(palette)]
+    return color_map
+
+_get_party_affiliations = None
+
+def _party_affiliations_getter():
+    """
+    Resolve supporting_agents.get_party_affiliations on first use.
+    Imported lazily because supporting_agents imports this module.
+    """
+    global _get_party_affiliations
+    if _get_party_affiliations is None:
+        from supporting_agents import get_party_affiliations
+        _get_party_affiliations = get_party_affiliations
+    return _get_party_affiliations
 
 async def get_colors(choices: List[str], poll_type: str, app_logger) -> Dict[str, str]:
     """
@@ -22,67 +128,22 @@ async def get_colors(choices: List[str], poll_type: str, app_logger) -> Dict[str
         poll_type: Type of poll (e.g., 'primary', 'generic-ballot', 'approval')
         app_logger: Logger to log errors
     Returns:
-        Dictionary mapping normalized choice names to hex color codes
+        Dictionary mapping normalized choice names to hex color codes; for
+        standard choice pairs this is a shared map that must not be mutated
     """
-    from supporting_agents import get_party_affiliations
-    
-
-    # Hardcoded color maps for common poll types
-    party_color_map = {
-        normalize_choice('Dem'): '#2563eb',
-        normalize_choice('Rep'): '#e02f28',
-        normalize_choice('Lib'): '#c4b937',
-        normalize_choice('Green'): '#288544',
-        normalize_choice('Other'): '#7f7f7f'
-    }
+    get_party_affiliations = _party_affiliations_getter()
 
     # Normalize all input choices for comparison
-    normalized_choices = [normalize_choice(c) for c in choices]
-
-    # Check for Dem/Rep choices
-    if 'Dem' in normalized_choices and 'Rep' in normalized_choices:
-        return party_color_map
-
-    # Check for Approve/Disapprove
-    if 'Approve' in normalized_choices and 'Disapprove' in normalized_choices:
-        return {
-            normalize_choice('Approve'): '#288544',
-            normalize_choice('Disapprove'): '#e08728'
-        }
-
-    # Check for Favorable/Unfavorable
-    if 'Favorable' in normalized_choices and 'Unfavorable' in normalized_choices:
-        return {
-            normalize_choice('Favorable'): '#288544',
-            normalize_choice('Unfavorable'): '#e08728'
-        }
-
-    # Check for Yes/No
-    if 'Yes' in normalized_choices and 'No' in normalized_choices:
-        return {
-            normalize_choice('Yes'): '#288544',
-            normalize_choice('No'): '#e08728'
-        }
+    normalized_choices = {normalize_choice(c) for c in choices}
+
+    # Check for Dem/Rep, Approve/Disapprove, Favorable/Unfavorable and Yes/No
+    for trigger, color_map in _STANDARD_COLOR_MAPS:
+        if trigger <= normalized_choices:
+            return color_map
 
     # For primaries, map each choice to a distinct color
     if 'primary' in poll_type.lower():
-        # Use colorblind-friendly categorical colors (Tableau 10)
-        palette = [
-            '#1f77b4',  # Blue
-            '#ff7f0e',  # Orange
-            '#2ca02c',  # Green
-            '#d62728',  # Red
-            '#9467bd',  # Purple
-            '#8c564b',  # Brown
-            '#e377c2',  # Pink
-            '#7f7f7f',  # Gray
-            '#bcbd22',  # Olive
-            '#17becf'   # Cyan
-        ]
-        color_map = {}
-        for idx, choice in enumerate(choices):
-            color_map[normalize_choice(choice)] = palette[idx % len(palette)]
-        return color_map
+        return _palette_map(choices, PRIMARY_PALETTE)
 
     # For candidate choices that may map to a party
     # Use get_party_affiliations to fetch party information
@@ -91,31 +152,14 @@ async def get_colors(choices: List[str], poll_type: str, app_logger) -> Dict[str
         app_logger.info(f"Fetching party affiliations for choices: {choices}")
         party_affiliations = await get_party_affiliations(choices)
         app_logger.info(f"Retrieved {len(party_affiliations)} party affiliations")
-    except Exception as e:
-        import traceback
-        tb = traceback.format_exc()
-        app_logger.error(f"Error getting party affiliations: {e}\n{tb}")
+    except Exception:
+        app_logger.exception("Error getting party affiliations")
         # If agent fails, we'll use fallback colors
 
     # If we have no affiliations at all, use fallback palette
     if not party_affiliations:
         app_logger.warning("No party affiliations found, using fallback palette")
-        palette = [
-            '#1f77b4',  # Blue
-            '#ff7f0e',  # Orange
-            '#2ca02c',  # Green
-            '#d62728',  # Red
-            '#9467bd',  # Purple
-            '#8c564b',  # Brown
-            '#e377c2',  # Pink
-            '#7f7f7f',  # Gray
-            '#bcbd22',  # Olive
-            '#17becf'   # Cyan
-        ]
-        color_map = {}
-        for idx, choice in enumerate(choices):
-            color_map[normalize_choice(choice)] = palette[idx % len(palette)]
-        return color_map
+        return _palette_map(choices, PRIMARY_PALETTE)
 
     # Count how many Dems/Reps in result
     party_counts = {}
@@ -125,63 +169,51 @@ async def get_colors(choices: List[str], poll_type: str, app_logger) -> Dict[str
             party_counts[party] = 0
         party_counts[party] += 1
 
-    # Extended color palettes for Dems and Reps
-    party_palettes = {
-        'Dem': [
-            '#2563eb',  # Original Dem blue
-            '#3b82f6',  # Lighter blue
-            '#1d4ed8',  # Darker blue
-            '#60a5fa',  # Even lighter blue
-            '#1e40af'   # Even darker blue
-        ],
-        'Rep': [
-            '#e02f28',  # Original Rep red
-            '#f87171',  # Lighter red
-            '#b91c1c',  # Darker red
-            '#fb7185',  # Even lighter red/pinkish
-            '#991b1b'   # Even darker red
-        ]
-    }
-
-    # Default fallback for other parties
-    default_party_colors = {
-        'Ind': '#eab308',  # yellow-ish for Independent
-        'Other': '#7c3aed'
-    }
-
     # Assign colors to each choice based on their party
     dem_index = 0
     rep_index = 0
     color_map = {}
 
-    for choice in choices:
-        # Find the party for this choice
-        # Try exact match first, then fuzzy match
-        affiliation = next((a for a in party_affiliations if a.person == choice), None)
+    # Pre-normalize both sides once into parallel lists
+    choice_norms = [normalize_choice(c) for c in choices]
+    aff_norms = [normalize_choice(a.person).lower() for a in party_affiliations]
 
-        if not affiliation:
-            # Try normalized comparison
-            normalized_choice_lower = normalize_choice(choice).lower()
-            affiliation = next((a for a in party_affiliations
-                              if normalize_choice(a.person).lower() == normalized_choice_lower), None)
+    # Index affiliations by exact and normalized name (first listed wins)
+    idx_by_exact = {}
+    idx_by_norm = {}
+    for i, a in enumerate(party_affiliations):
+        idx_by_exact.setdefault(a.person, i)
+        idx_by_norm.setdefault(aff_norms[i], i)
 
-        if not affiliation:
-            # Try substring matching (choice in person or person in choice)
-            affiliation = next((a for a in party_affiliations
-                              if choice.lower() in a.person.lower() or a.person.lower() in choice.lower()), None)
+    # Lowercased names for the substring fallback, built on the first miss
+    aff_lower = None
 
-        normalized_choice = normalize_choice(choice)
+    for choice, normalized_choice in zip(choices, choice_norms):
+        # Find the party for this choice
+        # Try exact match first, then normalized comparison
+        i = idx_by_exact.get(choice)
+        if i is None:
+            i = idx_by_norm.get(normalized_choice.lower())
+
+        if i is not None:
+            affiliation = party_affiliations[i]
+        else:
+            # Try substring matching (choice in person or person in choice)
+            if aff_lower is None:
+                aff_lower = [(a, a.person.lower()) for a in party_affiliations]
+            cl = choice.lower()
+            affiliation = next((a for a, al in aff_lower if cl in al or al in cl), None)
 
         if affiliation:
             party = affiliation.party
             if party == 'Dem':
-                color_map[normalized_choice] = party_palettes['Dem'][dem_index % len(party_palettes['Dem'])]
+                color_map[normalized_choice] = PARTY_PALETTES['Dem'][dem_index % len(PARTY_PALETTES['Dem'])]
                 dem_index += 1
             elif party == 'Rep':
-                color_map[normalized_choice] = party_palettes['Rep'][rep_index % len(party_palettes['Rep'])]
+                color_map[normalized_choice] = PARTY_PALETTES['Rep'][rep_index % len(PARTY_PALETTES['Rep'])]
                 rep_index += 1
             else:
-                color_map[normalized_choice] = default_party_colors.get(party, '#7f7f7f')  # fallback gray
+                color_map[normalized_choice] = DEFAULT_PARTY_COLORS.get(party, '#7f7f7f')  # fallback gray
         else:
             # No affiliation info, assign fallback gray
             color_map[normalized_choice] = '#7f7f7f'
@@ -3,7 +3,7 @@ import Attribution from './components/Attribution'
 
 export const metadata: Metadata = {
   title: 'VoteHub ChatBot',
-  description: 'Full stack app with Flask and NextJS',
+  description: 'Full stack app with FastAPI and NextJS',
 }
 
 export default function RootLayout({